@@ -0,0 +1,85 @@
+"""The command line interface to ``gendocs``. Run this from the directory
+holding your Sphinx ``conf.py`` to generate the documentation pages:
+
+.. code-block:: bash
+
+    $ python -m gendocs wonderfulpackage --index-base ../../README.rst
+
+Or only check that the packages can be documented, reporting every problem:
+
+.. code-block:: bash
+
+    $ python -m gendocs wonderfulpackage --validate-only
+
+To generate the pages on one machine and build them on another, write them
+into a single archive and unpack it next to ``conf.py`` on the other machine:
+
+.. code-block:: bash
+
+    $ python -m gendocs wonderfulpackage --bundle docs.tar.gz
+    $ python -m gendocs --extract docs.tar.gz
+"""
+
+__all__ = [
+    'main',
+]
+
+import argparse
+import importlib
+import sys
+
+from .bundle import ExtractBundle
+from .generator import Generator
+
+
+def main(argv=None):
+    """Runs the command line interface and returns the exit status"""
+    parser = argparse.ArgumentParser(
+        prog='python -m gendocs',
+        description='Automatically build the documentation pages for Python packages.')
+    parser.add_argument('packages', nargs='*',
+                        help='the importable names of the packages to document')
+    parser.add_argument('--index-base',
+                        help='the file name of the content to start the index page with')
+    parser.add_argument('--showprivate', action='store_true',
+                        help='display private members')
+    parser.add_argument('--showinh', action='store_true',
+                        help='display inherited members')
+    parser.add_argument('--dedupinh', action='store_true',
+                        help='link inherited members to the class that defines them')
+    parser.add_argument('--validate-only', action='store_true',
+                        help='only check the packages and report any problems')
+    parser.add_argument('--bundle', metavar='ARCHIVE',
+                        help='write all of the pages into this archive instead')
+    parser.add_argument('--extract', metavar='ARCHIVE',
+                        help='unpack the changed pages of a bundle and exit')
+    args = parser.parse_args(argv)
+
+    if args.extract is not None:
+        for name in ExtractBundle(args.extract):
+            sys.stdout.write('%s\n' % name)
+        return 0
+    if len(args.packages) < 1:
+        parser.error('at least one package is required')
+
+    packages = [importlib.import_module(name) for name in args.packages]
+    gen = Generator()
+    if args.validate_only:
+        problems = gen.DocumentPackages(packages, showprivate=args.showprivate,
+                                        validate_only=True)
+        for problem in problems:
+            sys.stderr.write('%s\n' % problem)
+        return 1 if len(problems) > 0 else 0
+    try:
+        gen.DocumentPackages(packages, index_base=args.index_base,
+                             showprivate=args.showprivate,
+                             showinh=args.showinh, dedupinh=args.dedupinh,
+                             bundle=args.bundle)
+    except RuntimeError as e:
+        sys.stderr.write('%s\n' % e)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
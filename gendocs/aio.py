@@ -0,0 +1,255 @@
+"""This provides an :mod:`asyncio` interface to the ``Generator`` so that an
+asynchronous build service can generate documentation without blocking its
+event loop. Introspection of the packages runs in an executor and every page
+is handed back to the event loop as soon as it is produced, where it is written
+concurrently (bounded by a semaphore) while introspection carries on.
+
+.. admonition:: Python 3.6+
+   :class: note
+
+    This module uses asynchronous generators and is not imported by default.
+
+.. code-block:: python
+
+    from gendocs import Generator
+    from gendocs.aio import agenerate
+
+    async def build(package, root):
+        async for event in agenerate(Generator(), package, root=root):
+            print('wrote %s' % event.path)
+
+Every concurrent build needs its own ``Generator``. Builds (asynchronous or
+not) on the same ``root`` hold its lock in turn, see :mod:`gendocs.stamp`.
+Cancelling the task consuming ``agenerate`` stops writing pages immediately and
+stops the introspection at the next page it produces. The lock is only released
+once the pages already being written are finished.
+"""
+
+__all__ = [
+    'ProgressEvent',
+    'agenerate',
+    'adocument',
+]
+
+import asyncio
+import collections
+import os
+import shutil
+import threading
+
+from . import stamp
+
+
+ProgressEvent = collections.namedtuple('ProgressEvent', ['name', 'path', 'written'])
+ProgressEvent.__doc__ = """A page was written: ``name`` is the documented module or
+package (``None`` for the top-level index), ``path`` is the page's path relative
+to the build root, and ``written`` is the number of pages written so far."""
+
+
+class _Cancelled(Exception):
+    """Raised in the introspection thread to abandon a cancelled build"""
+
+
+class _QueueSink(object):
+    """Receives pages from a ``Generator`` running in another thread and passes
+    them to the event loop."""
+
+    def __init__(self, loop, queue):
+        self.loop = loop
+        self.queue = queue
+        self.cancelled = threading.Event()
+        self.started = False
+
+    def _put(self, item):
+        if self.cancelled.is_set():
+            raise _Cancelled()
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, item)
+
+    def write(self, fname, text, name=None):
+        self._put(('write', fname, text, name))
+
+    def reset(self, path):
+        self._put(('reset', path, None, None))
+
+    def close(self):
+        if not self.cancelled.is_set():
+            self.loop.call_soon_threadsafe(self.queue.put_nowait, None)
+
+
+def _write(path, text):
+    """Writes a single page, creating its directory if needed"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as fid:
+        fid.write(text)
+
+
+def _reset(path):
+    """Empties (or creates) a directory of pages"""
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.makedirs(path)
+
+
+async def agenerate(generator, packages, index_base=None, root='.',
+                    concurrency=8, executor=None, reuse=False, **kwargs):
+    """Generates the documentation pages for the given package(s) and yields
+    a :class:`ProgressEvent` as each page is written. Nothing is yielded when
+    ``reuse`` keeps the pages of a previous run.
+
+    Args:
+        generator (Generator): The generator to use; it cannot be shared by concurrent builds
+        packages (list(module)): A list of packages that contain submodules to document
+        index_base (str): The index page file name. This content will be appended
+        root (str): The directory to write ``index.rst`` and ``content`` into
+        concurrency (int): The maximum number of pages written at once
+        executor (concurrent.futures.Executor): The executor to use (defaults to the loop's)
+        reuse (bool): A flag to keep the pages of a previous run when neither
+            the options nor the documented sources have changed since
+        **kwargs: Any other arguments to ``Generator.DocumentPackages`` except
+            ``validate_only`` and ``bundle``
+    """
+    for option in ('validate_only', 'bundle'):
+        if kwargs.pop(option, None):
+            raise TypeError('%s is not supported by the asynchronous API: use Generator.DocumentPackages.' % option)
+    if generator._sink is not None:
+        raise RuntimeError('This Generator is already producing pages: use one Generator per build.')
+    if concurrency < 1:
+        raise ValueError('concurrency must be at least 1.')
+    loop = asyncio.get_event_loop()
+    sink = _QueueSink(loop, asyncio.Queue())
+    generator._sink = sink
+    running = set()
+
+    def call(func, *args):
+        # Cancelling the caller cannot stop a call that already started in
+        # the executor: keep track of it so the lock outlives it
+        future = loop.run_in_executor(executor, func, *args)
+        running.add(future)
+        future.add_done_callback(running.discard)
+        return asyncio.shield(future)
+
+    # Builds on the same root (asynchronous or not) wait for each other
+    lock = stamp.FileLock(os.path.join(root, stamp.LOCK_NAME))
+
+    def acquire():
+        os.makedirs(root, exist_ok=True)
+        lock.acquire()
+
+    locking = loop.run_in_executor(executor, acquire)
+    try:
+        await asyncio.shield(locking)
+    except BaseException:
+        generator._sink = None
+        # Let go of the lock as soon as the abandoned wait gets it
+        locking.add_done_callback(lambda f: f.cancelled() or f.exception() or lock.release())
+        raise
+    try:
+        fingerprint = None
+        if reuse:
+            fingerprint = await call(
+                lambda: generator._Fingerprint(packages, index_base=index_base, **kwargs))
+            if await call(stamp.IsFresh, fingerprint, root):
+                return
+        await call(stamp.RemoveStamp, root)
+        pages = _generate(loop, sink, call, generator, packages, index_base,
+                          root, concurrency, executor, kwargs)
+        try:
+            async for event in pages:
+                yield event
+        finally:
+            # Stop writing pages before letting go of the lock
+            await pages.aclose()
+        if fingerprint is not None:
+            await call(stamp.WriteStamp, fingerprint, root)
+    finally:
+        if not sink.started:
+            generator._sink = None
+        # Only let go of the lock once nothing touches the tree any more
+        settled = asyncio.gather(*running, return_exceptions=True)
+        try:
+            await asyncio.shield(settled)
+        except BaseException:
+            # Cancelled again while waiting: release it when they are done
+            settled.add_done_callback(lambda f: lock.release())
+            raise
+        lock.release()
+
+
+async def _generate(loop, sink, call, generator, packages, index_base, root,
+                    concurrency, executor, kwargs):
+    """Produces and writes the pages of :func:`agenerate` while it holds the
+    lock, running every write and reset through ``call``"""
+    queue = sink.queue
+    semaphore = asyncio.Semaphore(concurrency)
+
+    def introspect():
+        try:
+            return generator._BuildIndex(packages, index_base=index_base, **kwargs)
+        finally:
+            # Only release the generator once it can no longer produce pages
+            generator._sink = None
+            sink.close()
+
+    async def write(name, fname, text):
+        async with semaphore:
+            await call(_write, os.path.join(root, fname), text)
+        return name, fname
+
+    sink.started = True
+    build = loop.run_in_executor(executor, introspect)
+    pending = set()
+    getter = None
+    written = 0
+    try:
+        finished = False
+        while not finished or pending:
+            waits = set(pending)
+            if not finished:
+                if getter is None:
+                    getter = asyncio.ensure_future(queue.get())
+                waits.add(getter)
+            done, _ = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task is getter:
+                    getter = None
+                    item = task.result()
+                    if item is None:
+                        finished = True
+                    elif item[0] == 'reset':
+                        # Pages already queued may live in this directory
+                        for name, fname in await asyncio.gather(*pending):
+                            written += 1
+                            yield ProgressEvent(name, fname, written)
+                        pending.clear()
+                        await call(_reset, os.path.join(root, item[1]))
+                    else:
+                        pending.add(asyncio.ensure_future(write(item[3], item[1], item[2])))
+                elif task in pending:
+                    pending.discard(task)
+                    name, fname = task.result()
+                    written += 1
+                    yield ProgressEvent(name, fname, written)
+        index = await build
+        await write(None, 'index.rst', index)
+        written += 1
+        yield ProgressEvent(None, 'index.rst', written)
+    finally:
+        sink.cancelled.set()
+        if getter is not None:
+            getter.cancel()
+        for task in pending:
+            task.cancel()
+        # Retrieve the outcome of an abandoned build so it is not reported
+        build.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+
+async def adocument(generator, packages, progress=None, **kwargs):
+    """Runs :func:`agenerate` to completion, calling ``progress`` (if given)
+    with every :class:`ProgressEvent`. This is what
+    ``Generator.DocumentPackagesAsync`` returns.
+    """
+    async for event in agenerate(generator, packages, **kwargs):
+        if progress is not None:
+            progress(event)
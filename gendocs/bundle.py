@@ -0,0 +1,158 @@
+"""This provides the single-archive output of ``gendocs``. Rather than writing
+thousands of small pages, the generated tree (``content`` and ``index.rst``)
+can be streamed into one tar or zip archive to hand off to another machine:
+
+.. code-block:: python
+
+    Generator().DocumentPackages(wonderfulpackage, bundle='docs.tar.gz')
+
+The archive format comes from the file name: ``.tar`` (uncompressed),
+``.tar.gz``/``.tgz``, ``.tar.bz2``, ``.tar.xz`` or ``.zip``. Unpack it where
+Sphinx runs with ``ExtractBundle`` (or ``python -m gendocs --extract``), which
+only rewrites the pages whose content changed.
+"""
+
+__all__ = [
+    'BundleWriter',
+    'ExtractBundle',
+]
+
+import hashlib
+import io
+import os
+import posixpath
+import tarfile
+import time
+import zipfile
+
+
+_TAR_MODES = [
+    ('.tar.gz', 'w:gz'),
+    ('.tgz', 'w:gz'),
+    ('.tar.bz2', 'w:bz2'),
+    ('.tar.xz', 'w:xz'),
+    ('.tar', 'w'),
+]
+
+
+class BundleWriter(object):
+    """Collects the pages produced by a ``Generator`` into a single archive,
+    written sequentially as the pages are produced.
+
+    Args:
+        filename (str): The archive to create; its extension sets the format
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._tar = None
+        self._zip = None
+        if filename.endswith('.zip'):
+            self._zip = zipfile.ZipFile(filename, 'w', zipfile.ZIP_DEFLATED)
+            return
+        for ext, mode in _TAR_MODES:
+            if filename.endswith(ext):
+                self._tar = tarfile.open(filename, mode)
+                return
+        raise RuntimeError('Unknown bundle format for (%s): use one of %s or .zip'
+                           % (filename, ', '.join([e for e, _ in _TAR_MODES])))
+
+    def write(self, fname, text, name=None):
+        """Adds a page to the archive"""
+        if not isinstance(text, bytes):
+            text = text.encode('utf-8')
+        fname = posixpath.normpath(fname)
+        if self._zip is not None:
+            self._zip.writestr(fname, text)
+            return
+        info = tarfile.TarInfo(fname)
+        info.size = len(text)
+        info.mtime = time.time()
+        info.mode = 0o644
+        self._tar.addfile(info, io.BytesIO(text))
+
+    def reset(self, path):
+        """Nothing to do: every archive starts empty"""
+        return None
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+        else:
+            self._tar.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        # Never leave a partial bundle behind
+        if exc_type is not None and os.path.exists(self.filename):
+            os.remove(self.filename)
+        return False
+
+
+def _Entries(filename):
+    """Yields the name and content of every file in an archive"""
+    if zipfile.is_zipfile(filename):
+        with zipfile.ZipFile(filename, 'r') as archive:
+            for info in archive.infolist():
+                if not info.filename.endswith('/'):
+                    yield info.filename, archive.read(info)
+        return
+    archive = tarfile.open(filename, 'r:*')
+    try:
+        for info in archive:
+            if info.isfile():
+                yield info.name, archive.extractfile(info).read()
+    finally:
+        archive.close()
+
+
+def _Digest(path):
+    """Returns the SHA-1 of a file on disk or ``None`` if it does not exist"""
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'rb') as fid:
+        return hashlib.sha1(fid.read()).hexdigest()
+
+
+def ExtractBundle(filename, root='.', prune=True):
+    """Unpacks a bundle written by ``BundleWriter``, only writing the pages
+    whose content differs from what is already on disk.
+
+    Args:
+        filename (str): The archive to unpack
+        root (str): The directory to unpack into (where ``conf.py`` lives)
+        prune (bool): A flag to remove pages under ``content`` that are not in the bundle
+
+    Returns:
+        list(str): The names of the pages that were written
+    """
+    written = []
+    names = set()
+    for name, data in _Entries(filename):
+        name = posixpath.normpath(name)
+        if posixpath.isabs(name) or name.split('/')[0] == '..':
+            raise RuntimeError('Refusing to extract (%s) outside of the root.' % name)
+        names.add(name)
+        path = os.path.join(root, *name.split('/'))
+        if _Digest(path) == hashlib.sha1(data).hexdigest():
+            continue
+        directory = os.path.dirname(path)
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+        with open(path, 'wb') as fid:
+            fid.write(data)
+        written.append(name)
+    if prune:
+        content = os.path.join(root, 'content')
+        for dirpath, dirnames, filenames in os.walk(content, topdown=False):
+            for f in filenames:
+                path = os.path.join(dirpath, f)
+                rel = os.path.relpath(path, root).replace(os.sep, '/')
+                if rel not in names:
+                    os.remove(path)
+            if dirpath != content and len(os.listdir(dirpath)) < 1:
+                os.rmdir(dirpath)
+    return written
@@ -16,6 +16,8 @@ For ``gendocs`` to work, every module being documented MUST contain an ``__all__
     Note that only what is defined in this module's ``__all__`` list is what is accessible and what gets documented.
     Without an ``__all__`` the documentation build will fail.
 
+Every package is validated before any pages are written and all of the problems found are reported at once. To only check your package, run ``python -m gendocs wonderfulpackage --validate-only`` or use ``Generator().DocumentPackages(wonderfulpackage, validate_only=True)``.
+
 Some optional variables:
 
 - ``__displayname__`` (``str``): include this attribute to change how the heading for any documented element is displayed
@@ -66,6 +68,39 @@ It's worth noting that you can control how private features are documented by pa
     Generator().DocumentPackages(wonderfulpackage, showprivate=True)
 
 
+Inherited Members
+^^^^^^^^^^^^^^^^^
+
+Passing ``showinh=True`` documents every inherited member again on each subclass. For deep class hierarchies, pass ``dedupinh=True`` instead: each inherited member is documented once on the class that defines it (or, for a base class that is not documented such as ``dict``, on the first documented class deriving from it) and every subclass gets a compact table of links to those members.
+
+.. code-block:: python
+
+    Generator().DocumentPackages(wonderfulpackage, dedupinh=True)
+
+
+Large Packages
+^^^^^^^^^^^^^^
+
+Sphinx embeds the navigation tree in every page, so very large APIs produce very large sites. Use ``toc_depths`` to set the ``:maxdepth:`` of the toctrees at each level (the top-level index, the package pages, then each level of sub-packages) and ``toc_max_entries`` to split any longer toctree into alphabetical sub-index pages:
+
+.. code-block:: python
+
+    gen = Generator(toc_depths=[1, 2], toc_max_entries=50)
+    gen.DocumentPackages(wonderfulpackage)
+
+
+Repeated Builds
+^^^^^^^^^^^^^^^
+
+Sphinx evaluates ``conf.py`` once per builder, so ``make html latexpdf`` generates the pages twice. Generation always holds a lock on the output directory (a ``.gendocs.lock`` file removed when the run finishes) so concurrent runs wait for each other. Pass ``reuse=True`` to keep the pages of the previous run when neither the options nor the documented sources have changed since and none of its pages were removed or edited:
+
+.. code-block:: python
+
+    Generator().DocumentPackages(wonderfulpackage, reuse=True)
+
+The previous run is recorded in a ``.gendocs-stamp`` file next to ``index.rst``: add it to your ``.gitignore``.
+
+
 Custom Homepage
 ^^^^^^^^^^^^^^^
 
@@ -95,10 +130,14 @@ __all__ = [
 
 import inspect
 import os
+import posixpath
 import sys
 import shutil
 import properties
 
+from .bundle import BundleWriter
+from . import stamp
+
 appIndex = '''
 
 .. toctree::
@@ -145,8 +184,9 @@ class Classifier(object):
 ###############################################################################
 
     @staticmethod
-    def GetClassText(heading, name, showprivate=False, showinh=False):
-        """Returns the needed text to automatically document a class in RSF/sphinx"""
+    def GetClassText(heading, name, showprivate=False, showinh=False, members=None):
+        """Returns the needed text to automatically document a class in RSF/sphinx.
+        Pass ``members`` to document only the members with those names."""
         und = '-'*len(heading)
         avail = [':private-members:', ':inherited-members:']
         opts = []
@@ -155,6 +195,10 @@ class Classifier(object):
         if showinh:
             opts.append(avail[1])
         opts = '\n'.join(opts)
+        if members is not None:
+            members = ' ' + ', '.join(members)
+        else:
+            members = ''
         return r'''
 
 %s
@@ -162,11 +206,60 @@ class Classifier(object):
 
 .. autoclass:: %s
     :show-inheritance:
-    :members:
+    :members:%s
     :undoc-members:
     %s
 
-''' % (heading, und, name, opts)
+''' % (heading, und, name, members, opts)
+
+###############################################################################
+
+    @staticmethod
+    def GetInheritedText(inherited):
+        """Returns the needed text to link a class's inherited members back to
+        the classes that define (and document) them in RSF/sphinx
+
+        Args:
+            inherited (list(tuple)): pairs of the defining class's documented
+                path and a list of ``(role, member name)`` pairs
+
+        Returns:
+            str: a compact table of links or an empty string if nothing is inherited
+        """
+        if len(inherited) < 1:
+            return ''
+        rows = []
+        for path, members in inherited:
+            links = ', '.join([':%s:`~%s.%s`' % (role, path, m) for role, m in members])
+            rows.append('":class:`~%s`", "%s"' % (path, links))
+        return r'''
+
+.. rubric:: Inherited members
+
+.. csv-table::
+   :header: "Inherited from", "Members"
+
+   %s
+
+''' % ('\n   '.join(rows))
+
+###############################################################################
+
+    @staticmethod
+    def GetToctreeText(entries, maxdepth=5, caption=None, hidden=False):
+        """Returns the needed text for a toctree of the given entries in RSF/sphinx"""
+        opts = [':maxdepth: %d' % maxdepth]
+        if hidden:
+            opts.append(':hidden:')
+        if caption is not None:
+            opts.append(':caption: %s:' % caption)
+        return r'''
+
+.. toctree::
+   %s
+
+   %s
+''' % ('\n   '.join(opts), '\n   '.join(entries))
 
 ###############################################################################
 
@@ -201,6 +294,10 @@ class Generator(properties.HasProperties):
         self.__stats = None
         # A dictionary to keep track of Statistics base on the ``__category__`` variable of any documented element.
         self.__categories = dict()
+        # A dictionary mapping each documented class to the path it is documented under
+        self.__classpaths = dict()
+        # An optional object receiving pages and directory resets instead of the disk
+        self._sink = None
 
 
     path = properties.String(
@@ -208,6 +305,122 @@ class Generator(properties.HasProperties):
             default='content'
             )
 
+    toc_depths = properties.List(
+            'The ``:maxdepth:`` of the toctrees at each level: the top-level index, the package pages, then each level of sub-package pages. The last value is used for any deeper levels.',
+            prop=properties.Integer('The ``:maxdepth:`` of a toctree', min=1),
+            default=[5],
+            min_length=1
+            )
+
+    toc_max_entries = properties.Integer(
+            'The most entries a toctree may list before it is split into alphabetical sub-index pages. Use ``0`` to never split toctrees, otherwise this must be at least ``2``.',
+            default=0,
+            min=0
+            )
+
+    @properties.validator('toc_max_entries')
+    def _ValidateTocMaxEntries(self, change):
+        """A toctree of one entry cannot be split into fewer entries"""
+        if change['value'] == 1:
+            raise properties.ValidationError(
+                'toc_max_entries must be 0 (never split) or at least 2.',
+                prop='toc_max_entries', instance=self)
+
+    @properties.validator('toc_depths')
+    def _ValidateTocDepths(self, change):
+        """Every toctree needs a depth, so at least one must be given"""
+        if len(change['value']) < 1:
+            raise properties.ValidationError(
+                'toc_depths must list at least one depth.',
+                prop='toc_depths', instance=self)
+
+
+    def _WritePage(self, fname, text, name=None):
+        """An internal helper to save a page. Pages are handed to the sink
+        when one is set, otherwise they are written to disk.
+
+        Args:
+            fname (str): The relative file name of the page
+            text (str): The RST content of the page
+            name (str): The name of the documented module or package
+        """
+        if self._sink is not None:
+            return self._sink.write(fname, text, name)
+        with open(fname, 'w') as fid:
+            fid.write(text)
+        return None
+
+    def _ResetDirectory(self, path):
+        """An internal helper to empty (or create) a directory of pages. This
+        is handed to the sink when one is set.
+
+        Args:
+            path (str): The relative directory to reset
+        """
+        if self._sink is not None:
+            return self._sink.reset(path)
+        if os.path.exists(path):
+            shutil.rmtree(path)
+        os.makedirs(path)
+        return None
+
+
+    def _MakeToctree(self, directory, entries, level, caption=None, hidden=False, name=None):
+        """An internal helper to produce a toctree for a page. Toctrees with
+        more than ``toc_max_entries`` entries are split into alphabetical
+        sub-index pages so that every toctree stays small.
+
+        Args:
+            directory (str): The directory of the page holding the toctree (entries are relative to it)
+            entries (list(str)): The file names to list
+            level (int): The nesting level of the page (``0`` is the top-level index)
+            caption (str): An optional caption for the toctree
+            hidden (bool): A flag for whether or not to hide the toctree
+            name (str): The name of the package the page documents
+
+        Returns:
+            str: The toctree text
+        """
+        maxdepth = self.toc_depths[min(level, len(self.toc_depths) - 1)]
+        limit = self.toc_max_entries
+        if limit > 0 and len(entries) > limit:
+            # Sub-index pages are stored with the other pages, never in the docs root
+            pagedir = directory if directory != '.' else 'content'
+            entries = self._PaginateEntries(directory, pagedir, entries, maxdepth, '', name)
+        return Classifier.GetToctreeText(entries, maxdepth=maxdepth, caption=caption, hidden=hidden)
+
+    def _PaginateEntries(self, directory, pagedir, entries, maxdepth, suffix, name=None):
+        """An internal helper to split toctree entries into at most
+        ``toc_max_entries`` alphabetical ranges, each written as its own
+        sub-index page (recursively split when still too large).
+
+        Returns:
+            list(str): The sub-index file names relative to ``directory``
+        """
+        def label(entry):
+            entry = entry[:-len('/index.rst')] if entry.endswith('/index.rst') else entry[:-len('.rst')]
+            return posixpath.basename(entry)
+
+        limit = self.toc_max_entries
+        entries = sorted(entries, key=lambda e: label(e).lower())
+        count = min(limit, -(-len(entries) // limit))
+        size = -(-len(entries) // count)
+        pages = []
+        for i in range(0, len(entries), size):
+            chunk = entries[i:i+size]
+            sub = '%s-%d' % (suffix, len(pages) + 1)
+            fname = '%s/_toc%s.rst' % (pagedir, sub)
+            # Entries are relative to the page listing them
+            chunk = [posixpath.relpath(posixpath.join(directory, e), pagedir) for e in chunk]
+            if len(chunk) > limit:
+                chunk = self._PaginateEntries(pagedir, pagedir, chunk, maxdepth, sub, name)
+            title = '%s - %s' % (label(entries[i]), label(entries[min(i+size, len(entries)) - 1]))
+            text = '\n%s\n%s\n' % (title, '*' * len(title))
+            text += Classifier.GetToctreeText(chunk, maxdepth=maxdepth)
+            self._WritePage(fname, text, name=name)
+            pages.append(posixpath.relpath(fname, directory))
+        return pages
+
 
     def _GenerateStaticsTable(self, title='Current Statistics'):
         """Generates a statics table based on set categories"""
@@ -230,7 +443,146 @@ class Generator(properties.HasProperties):
 
 ''' % (title, '-'*len(title), cats, vals)
 
-    def _ProduceSingleContent(self, mod, showprivate=False, showinh=False):
+    @classmethod
+    def _MapDocumentedClasses(cls, packages, showprivate=False):
+        """An internal helper to find where every class in the given packages
+        will be documented. This walks the modules with :meth:`_SplitModules`
+        like :meth:`_MakePackagePages` does so only classes that get their own
+        ``autoclass`` on a written page are mapped. Classes exposed by several
+        modules are mapped to the module that defines them when possible.
+
+        Args:
+            packages (list(module)): The packages that will be documented
+            showprivate (bool): A flag for whether or not to display private members
+
+        Returns:
+            dict: the documented path (``module.Class``) keyed by class
+        """
+        classpaths = dict()
+        stack = list(packages)
+        while len(stack) > 0:
+            mods, pkgs = cls._SplitModules(stack.pop())
+            # Package pages do not document classes
+            stack += [pkg[1] for pkg in pkgs]
+            for mod in mods:
+                # Only modules that get their own page (see _ProduceContent)
+                if not showprivate and mod[0][0:1] == '_':
+                    continue
+                if mod[0][0:2] == '__':
+                    continue
+                for name, obj in inspect.getmembers(mod[1], inspect.isclass):
+                    if name not in mod[1].__all__:
+                        continue
+                    if not showprivate and name[0:1] == '_':
+                        continue
+                    path = '%s.%s' % (mod[1].__name__, obj.__name__)
+                    if obj.__module__ == mod[1].__name__:
+                        classpaths[obj] = path
+                    else:
+                        classpaths.setdefault(obj, path)
+        return classpaths
+
+
+    def _InheritedMembers(self, cls, showprivate=False):
+        """An internal helper to walk the MRO of a class and sort its inherited
+        members by the documented class they are documented on: the class that
+        defines them or, for members of a class that is not documented (such as
+        ``dict`` or a third party base), the documented class nearest to it.
+
+        Args:
+            cls (type): The class being documented
+            showprivate (bool): A flag for whether or not to display private members
+
+        Returns:
+            tuple: a list of pairs of the documented path of another class and
+            a list of ``(role, member name)`` pairs, in MRO order, and a list of
+            the names of the members to document on ``cls`` itself (``None``
+            when every inherited member is documented elsewhere)
+        """
+        def shown(name):
+            return name[0:2] != '__' and (showprivate or name[0:1] != '_')
+
+        mro = inspect.getmro(cls)
+        documented = [cls] + [base for base in mro[1:] if base in self.__classpaths]
+        seen = set(vars(cls).keys())
+        owners = []
+        links = dict()
+        inline = []
+        for base in mro[1:]:
+            members = []
+            for name, obj in sorted(vars(base).items()):
+                if name in seen or not shown(name):
+                    continue
+                if inspect.isroutine(obj) or isinstance(obj, (staticmethod, classmethod)):
+                    members.append(('meth', name))
+                else:
+                    members.append(('attr', name))
+            seen.update(vars(base).keys())
+            if len(members) < 1:
+                continue
+            # The last documented class in the MRO deriving from base is the
+            # same for every documented subclass (the MRO is monotonic)
+            owner = [d for d in documented if base in inspect.getmro(d)][-1]
+            if owner is cls:
+                inline += [m for _, m in members]
+                continue
+            if owner not in links:
+                owners.append(owner)
+                links[owner] = []
+            links[owner] += members
+        inherited = [(self.__classpaths[o], links[o]) for o in owners]
+        if len(inline) < 1:
+            return inherited, None
+        own = [name for name in vars(cls).keys() if shown(name)]
+        return inherited, sorted(own + inline)
+
+
+    @staticmethod
+    def _CheckNoNested(mod):
+        """An internal helper to tell if a module is a `module` in the sense of
+        ``gendocs``: it has an ``__all__`` and exposes no further modules.
+        """
+        try:
+            all = mod.__all__
+        except AttributeError:
+            return False
+        mems = inspect.getmembers(mod, inspect.ismodule)
+        mems = [m for m in mems if m[0] in mod.__all__]
+
+        if len(mems) > 0:
+            return False
+        return True
+
+    @classmethod
+    def _SplitModules(cls, package):
+        """An internal helper to find what to document under a package. Only
+        the package's own submodules are considered so that modules it merely
+        imports (from the standard library or other packages) are never walked.
+        Every page generation and validation goes through this.
+
+        Returns:
+            tuple: lists of ``(name, module)`` pairs of the modules (see
+            :meth:`_CheckNoNested`) and of the sub-packages
+        """
+        mods, pkgs = [], []
+        found = set()
+        for mod in inspect.getmembers(package, inspect.ismodule):
+            if mod[1].__name__.rpartition('.')[0] != package.__name__ or mod[1].__name__ in found:
+                continue
+            found.add(mod[1].__name__)
+            if cls._CheckNoNested(mod[1]):
+                mods.append(mod)
+            else:
+                pkgs.append(mod)
+        return mods, pkgs
+
+    @staticmethod
+    def _ModulePage(name):
+        """An internal helper to get the file name of a module's page"""
+        return 'content/' + name.replace('.', '/').replace(' ', '-')+'.rst'
+
+
+    def _ProduceSingleContent(self, mod, showprivate=False, showinh=False, dedupinh=False):
         """An internal helper to create a page for a single module. This will
         automatically generate the needed RSF to document the module
         and save the module to its own page in its appropriate location.
@@ -238,6 +590,8 @@ class Generator(properties.HasProperties):
         Args:
             mod (module): The single module to document as its own page
             showprivate (bool): A flag for whether or not to display private members
+            dedupinh (bool): A flag to link inherited members to their defining
+                class rather than documenting them again
 
         Returns:
             str: The file name ready to be appended to a toctree
@@ -257,36 +611,40 @@ class Generator(properties.HasProperties):
         except AttributeError:
             pass
         feats = inspect.getmembers(mod[1])
-        fname = 'content/' + mod[1].__name__.replace('.', '/').replace(' ', '-')+'.rst'
+        fname = self._ModulePage(mod[1].__name__)
         feats = [f for f in feats if f[0] in all and (showprivate or not f[0][0:1] == '_')]
-        with open(fname, 'w') as fid:
-            fid.write(Classifier.GetModuleText(name, mod[1].__name__, showprivate=showprivate))
-
-            for f in feats:
-                # Check for a __displayname__
-                if inspect.isclass(f[1]) or inspect.isfunction(f[1]):
-                    try:
-                        featname = f[1].__displayname__
-                    except AttributeError:
-                        featname = f[1].__name__
-                    try:
-                        category = f[1].__category__
-                        self.__categories.setdefault(category, 0)
-                        self.__categories[category] += 1
-                    except AttributeError:
-                        pass
-                    # Make the auto doc rst
-                    if inspect.isclass(f[1]):
-                        fid.write(Classifier.GetClassText(featname, '%s.%s' % (mod[1].__name__, f[1].__name__), showprivate=showprivate, showinh=showinh))
-                    elif inspect.isfunction(f[1]):
-                         fid.write(Classifier.GetFunctionText(featname, '%s.%s' %  (mod[1].__name__, f[1].__name__)))
-
-            fid.close()
+        text = Classifier.GetModuleText(name, mod[1].__name__, showprivate=showprivate)
+
+        for f in feats:
+            # Check for a __displayname__
+            if inspect.isclass(f[1]) or inspect.isfunction(f[1]):
+                try:
+                    featname = f[1].__displayname__
+                except AttributeError:
+                    featname = f[1].__name__
+                try:
+                    category = f[1].__category__
+                    self.__categories.setdefault(category, 0)
+                    self.__categories[category] += 1
+                except AttributeError:
+                    pass
+                # Make the auto doc rst
+                if inspect.isclass(f[1]):
+                    if dedupinh:
+                        inherited, members = self._InheritedMembers(f[1], showprivate=showprivate)
+                        text += Classifier.GetClassText(featname, '%s.%s' % (mod[1].__name__, f[1].__name__), showprivate=showprivate, members=members)
+                        text += Classifier.GetInheritedText(inherited)
+                    else:
+                        text += Classifier.GetClassText(featname, '%s.%s' % (mod[1].__name__, f[1].__name__), showprivate=showprivate, showinh=showinh)
+                elif inspect.isfunction(f[1]):
+                    text += Classifier.GetFunctionText(featname, '%s.%s' %  (mod[1].__name__, f[1].__name__))
+
+        self._WritePage(fname, text, name=mod[1].__name__)
         return '\n   %s' % (fname.split('/')[-1])
 
 
 
-    def _ProduceContent(self, mods, showprivate=False, showinh=False):
+    def _ProduceContent(self, mods, showprivate=False, showinh=False, dedupinh=False):
         """An internal helper to create pages for several modules that do not have nested modules.
         This will automatically generate the needed RSF to document each module module
         and save the module to its own page appropriately.
@@ -312,59 +670,37 @@ class Generator(properties.HasProperties):
                 continue
             if mod[0][0:2] == '__': #and not showprivate
                 continue
-            result += self._ProduceSingleContent(mod, showprivate, showinh)
+            result += self._ProduceSingleContent(mod, showprivate, showinh, dedupinh)
         return result
 
 
 
 
-    def _MakePackagePages(self, package, showprivate=False, nested=False, showinh=False):
+    def _MakePackagePages(self, package, showprivate=False, nested=False, showinh=False, dedupinh=False, level=1):
         """An internal helper to generate all of the pages for a given package
 
         Args:
             package (module): The top-level package to document
             showprivate (bool): A flag for whether or not to display private members
             nested (bool): Foor internal use ONLY
+            level (int): Foor internal use ONLY
 
         Returns:
             str: The file names ready to be appended to a top-level toctree
         """
-
-        def checkNoNested(mod):
-            try:
-                all = mod.__all__
-            except AttributeError:
-                return False
-            mems = inspect.getmembers(mod, inspect.ismodule)
-            mems = [m for m in mems if m[0] in mod.__all__]
-
-            if len(mems) > 0:
-                return False
-            return True
-
-        # Get package module members
-        mods = inspect.getmembers(package, inspect.ismodule)
-        # Split into modules and sub-packages
-        nmods, pvt, npkgs = [], [], []
-        for mod in mods:
-            # Deal with private modules
-            if checkNoNested(mod[1]):
-                if mod[0][0] == '_': pvt.append(mod)
-                else: nmods.append(mod)
-            else: npkgs.append(mod)
-        if showprivate: nmods += pvt
+        # Split the package's own submodules into modules and sub-packages
+        mods, npkgs = self._SplitModules(package)
+        # Deal with private modules
+        nmods = [mod for mod in mods if showprivate or mod[0][0] != '_']
 
 
         # for each member that has a nested module
             # recurse and keep track of index files for that package
         files = []
-        ignore = []
         for pkg in npkgs:
             pt = '%s/%s/%s' % (self.path, package.__name__.replace('.', '/'), pkg[1].__name__.split('.')[-1])
-            if os.path.exists(pt): shutil.rmtree(pt)
-            os.makedirs(pt)
-            ignore += inspect.getmembers(pkg[1])
-            f = self._MakePackagePages(pkg[1], showprivate=showprivate, nested=True, showinh=showinh)
+            self._ResetDirectory(pt)
+            f = self._MakePackagePages(pkg[1], showprivate=showprivate, nested=True, showinh=showinh, dedupinh=dedupinh, level=level+1)
             files.append(f.split(package.__name__.replace('.', '/')+'/')[1])
 
         if nested:
@@ -376,33 +712,28 @@ class Generator(properties.HasProperties):
             index = r'''
 %s
 %s
-
-.. toctree::
-   :maxdepth: 5
-
-    ''' % (name, '*' * len(name))
-            # include sub packages first
-            index += '\n   '.join(files)
-            # then include modules
-            index += '\n   ' + self._ProduceContent(nmods, showprivate=showprivate, showinh=showinh)
-            findex = 'content/%s/index.rst' % (package.__name__.replace('.', '/'))
+''' % (name, '*' * len(name))
+            # include sub packages first then include modules
+            entries = files + self._ProduceContent(nmods, showprivate=showprivate, showinh=showinh, dedupinh=dedupinh).split('\n   ')
+            entries = [e.strip() for e in entries if e.strip()]
+            directory = 'content/%s' % (package.__name__.replace('.', '/'))
+            index += self._MakeToctree(directory, entries, level, name=package.__name__)
+            findex = '%s/index.rst' % (directory)
 
             # Write the file
-            with open(findex, 'w') as f:
-                if package.__doc__: f.write(package.__doc__)
-                f.write(index)
+            if package.__doc__: index = package.__doc__ + index
+            self._WritePage(findex, index, name=package.__name__)
 
             # return filename for index file at package level
             return '\n   ' + findex
 
         # Not nested: return all files
         names = '\n   %s/%s/' % ( self.path, package.__name__.replace('.', '/'))
-        nmods = [m for m in nmods if m not in ignore]
-        return names.join(self._ProduceContent(nmods, showprivate=showprivate, showinh=showinh).split('\n   ')+files)
+        return names.join(self._ProduceContent(nmods, showprivate=showprivate, showinh=showinh, dedupinh=dedupinh).split('\n   ')+files)
 
 
 
-    def _DocPackageFromTop(self, packages, showprivate=False, showinh=False):
+    def _DocPackageFromTop(self, packages, showprivate=False, showinh=False, dedupinh=False):
         """Generates all of the documentation for given packages and
         appends new tocrees to the index. All documentation pages will be under the
         set relative path.
@@ -418,18 +749,11 @@ class Generator(properties.HasProperties):
         if not isinstance(packages, list):
             packages = [packages]
 
-        if os.path.exists('content'):
-            shutil.rmtree('content')
-        os.makedirs('content')
-
-        appIndex += r'''
-
-.. toctree::
-   :maxdepth: 5
-   :hidden:
-   :caption: %s:
+        if dedupinh:
+            self.__classpaths = self._MapDocumentedClasses(packages, showprivate=showprivate)
 
-''' % ('API Index')
+        self._ResetDirectory('content')
+        abouts = []
 
         # Iterate over each package and generate appropriate pages
         for i in range(len(packages)):
@@ -441,9 +765,7 @@ class Generator(properties.HasProperties):
                 name = package.__name__
             # Make sure paths are ready
             path = 'content/%s' % package.__name__
-            if os.path.exists(path):
-                shutil.rmtree(path)
-            os.makedirs(path)
+            self._ResetDirectory(path)
 
             # Check if there is top level documentation
             # if package.__doc__:
@@ -459,28 +781,79 @@ class Generator(properties.HasProperties):
             if version: meta += '\n* Version: %s' % version
             about = '%s/%s' % (path, 'index.rst')
 
-            this_toc = r'''
+            entries = self._MakePackagePages(package, showprivate=showprivate, showinh=showinh, dedupinh=dedupinh)
+            entries = entries.replace('%s/' % path, '').split('\n   ')
+            entries = [e.strip() for e in entries if e.strip()]
+            this_toc = self._MakeToctree(path, entries, 1, caption=name, name=package.__name__)
 
-.. toctree::
-   :maxdepth: 5
-   :caption: %s:
-''' % (name)
+            text = '%s\n\n' % meta
+            if package.__doc__:
+                text += package.__doc__
+            self._WritePage(about, text + this_toc, name=package.__name__)
 
-            this_toc += self._MakePackagePages(package, showprivate=showprivate, showinh=showinh)
-            this_toc = this_toc.replace('%s/' % path, '')
+            abouts.append(about)
 
-            with open(about, 'w') as f:
-                f.write('%s\n\n' % meta)
-                if package.__doc__:
-                    f.write(package.__doc__)
-                f.write(this_toc)
-
-            appIndex += '\n   %s' % about
+        appIndex += self._MakeToctree('.', abouts, 0, caption='API Index', hidden=True)
 
         # Return the new content to append
         return appIndex
 
 
+    def Validate(self, packages, showprivate=False):
+        """Checks that the given package(s) can be documented without writing
+        anything. Every problem is reported at once: modules missing an
+        ``__all__``, names in an ``__all__`` that do not exist, and different
+        modules or packages that would be written to the same page. The
+        modules are walked with :meth:`_SplitModules` exactly like page
+        generation does, so modules imported from elsewhere are ignored.
+
+        Args:
+            packages (list(module)): A package or list of packages that contain submodules to document
+            showprivate (bool): A flag for whether or not to display private members
+
+        Returns:
+            list(str): The problems found (empty if the packages are ready to document)
+        """
+        if not isinstance(packages, list):
+            packages = [packages]
+        problems = []
+        pages = dict()
+
+        def addPage(fname, name):
+            other = pages.setdefault(fname, name)
+            if other != name:
+                problems.append('Page (%s) would be written by both (%s) and (%s).' % (fname, other, name))
+
+        def checkAll(mod):
+            for name in getattr(mod, '__all__', []):
+                if not hasattr(mod, name):
+                    problems.append('Module (%s) lists (%s) in `__all__` but does not define it.' % (mod.__name__, name))
+
+        for package in packages:
+            addPage('content/%s/index.rst' % package.__name__, package.__name__)
+            checkAll(package)
+            # External modules are not the responsibility of this package
+            stack = [package]
+            while len(stack) > 0:
+                mods, pkgs = self._SplitModules(stack.pop())
+                for mod in mods:
+                    if showprivate or mod[0][0:1] != '_':
+                        checkAll(mod[1])
+                        if mod[0][0:2] != '__':
+                            addPage(self._ModulePage(mod[1].__name__), mod[1].__name__)
+                for pkg in pkgs:
+                    shown = showprivate or pkg[0][0:1] != '_'
+                    if not hasattr(pkg[1], '__path__') and not hasattr(pkg[1], '__all__'):
+                        if shown:
+                            problems.append('Module (%s) MUST have `__all__` defined.' % pkg[1].__name__)
+                        continue
+                    if shown:
+                        checkAll(pkg[1])
+                    addPage('content/%s/index.rst' % pkg[1].__name__.replace('.', '/'), pkg[1].__name__)
+                    stack.append(pkg[1])
+        return problems
+
+
     @staticmethod
     def OpenIndex(filename):
         with open(filename, 'r') as fid:
@@ -495,16 +868,40 @@ class Generator(properties.HasProperties):
         return None
 
 
-    def DocumentPackages(self, packages, index_base=None, showprivate=False,
-                         notify=True, showinh=False, intro_pages=None,
-                         append_material=None, extra=None):
-        """This is the high level API to use to generate documentation pages for any given package(s).
+    def _Fingerprint(self, packages, **kwargs):
+        """An internal helper to fingerprint a run: its options, this
+        generator's properties, the index base and the documented sources.
+        Takes the same arguments as :meth:`_BuildIndex`.
 
-        Args:
-            packages (list(module)): A list of packages that contain submodules to document
-            index_base (str): The index page file name. This content will be appended
-            showprivate (bool): A flag for whether or not to display private members
+        Returns:
+            str: The fingerprint to record in (or compare with) the run stamp
+        """
+        pkgs = packages if isinstance(packages, list) else [packages]
+        options = dict(kwargs, generator=self.serialize(include_class=False))
+        options['packages'] = [p.__name__ for p in pkgs]
+        index_base = kwargs.get('index_base', None)
+        if index_base is not None and os.path.exists(index_base):
+            st = os.stat(index_base)
+            options['index_base'] = (index_base, st.st_mtime, st.st_size)
+        return stamp.Fingerprint(pkgs, options)
+
+
+    def _BuildIndex(self, packages, index_base=None, showprivate=False,
+                    notify=True, showinh=False, intro_pages=None,
+                    append_material=None, extra=None, dedupinh=False):
+        """An internal helper to generate all of the pages for the given
+        packages and produce the content of the top-level index. See
+        :meth:`DocumentPackages` for the arguments.
+
+        Returns:
+            str: The content of the top-level ``index.rst``
         """
+        # Make sure the options and the whole tree are valid before any pages are written
+        self.validate()
+        problems = self.Validate(packages, showprivate=showprivate)
+        if len(problems) > 0:
+            raise RuntimeError('Cannot document the package(s), %d problem(s) found:\n%s'
+                               % (len(problems), '\n'.join(['- ' + p for p in problems])))
         if index_base is None:
             gram = ''
             if isinstance(packages, list) and len(packages) > 1:
@@ -516,11 +913,13 @@ class Generator(properties.HasProperties):
                     names[-1] = ' and %s' % names[-1]
                     names = ', '.join(names)
             else:
+                if isinstance(packages, list):
+                    packages = packages[0]
                 names = '``%s``' % packages.__name__
             index = SAMPLE_INDEX.format(names, gram)
         else:
             index = self.OpenIndex(index_base)
-        app = self._DocPackageFromTop(packages, showprivate=showprivate, showinh=showinh)
+        app = self._DocPackageFromTop(packages, showprivate=showprivate, showinh=showinh, dedupinh=dedupinh)
         index += self._GenerateStaticsTable()
         index += """
 .. toctree::
@@ -551,5 +950,87 @@ class Generator(properties.HasProperties):
 .. _Learn more: https://gendocs.readthedocs.io/en/latest/
 
 """
-        self.WriteIndex(index)
+        return index
+
+
+    def DocumentPackages(self, packages, index_base=None, showprivate=False,
+                         notify=True, showinh=False, intro_pages=None,
+                         append_material=None, extra=None, dedupinh=False,
+                         validate_only=False, bundle=None, reuse=False):
+        """This is the high level API to use to generate documentation pages for any given package(s).
+
+        Args:
+            packages (list(module)): A list of packages that contain submodules to document
+            index_base (str): The index page file name. This content will be appended
+            showprivate (bool): A flag for whether or not to display private members
+            showinh (bool): A flag for whether or not to display inherited members
+            dedupinh (bool): A flag to document each inherited member only once,
+                on the class that defines it, and give subclasses a table of
+                links to those members instead (this overrides ``showinh``)
+            validate_only (bool): A flag to only check the package(s) with
+                :meth:`Validate` and return the problems found without writing anything
+            bundle (str): An archive file name (``.tar``, ``.tar.gz``, ``.zip``, ...)
+                to write all of the pages into instead of writing them to disk
+                (see :mod:`gendocs.bundle`)
+            reuse (bool): A flag to keep the pages of a previous run when
+                neither the options nor the documented sources have changed
+                since (see :mod:`gendocs.stamp`). A bundle is always written
+                in full so this cannot be used with ``bundle``.
+        """
+        if validate_only:
+            return self.Validate(packages, showprivate=showprivate)
+        if reuse and bundle is not None:
+            raise RuntimeError('reuse cannot be used with bundle: a bundle is always written in full.')
+        kwargs = dict(index_base=index_base, showprivate=showprivate,
+                      notify=notify, showinh=showinh, intro_pages=intro_pages,
+                      append_material=append_material, extra=extra,
+                      dedupinh=dedupinh)
+        if bundle is not None:
+            with BundleWriter(bundle) as sink:
+                self._sink = sink
+                try:
+                    index = self._BuildIndex(packages, **kwargs)
+                finally:
+                    self._sink = None
+                sink.write('index.rst', index)
+            return None
+        # Concurrent runs on the same output wait for each other
+        with stamp.FileLock(stamp.LOCK_NAME):
+            fingerprint = None
+            if reuse:
+                fingerprint = self._Fingerprint(packages, **kwargs)
+                if stamp.IsFresh(fingerprint):
+                    return None
+            stamp.RemoveStamp()
+            index = self._BuildIndex(packages, **kwargs)
+            self.WriteIndex(index)
+            if fingerprint is not None:
+                stamp.WriteStamp(fingerprint)
         return None
+
+
+    def DocumentPackagesAsync(self, packages, index_base=None, root='.',
+                              concurrency=8, progress=None, executor=None,
+                              **kwargs):
+        """The :mod:`asyncio` counterpart of :meth:`DocumentPackages` for use
+        in services that drive many documentation builds from one event loop.
+        Introspection runs in an executor while pages are written concurrently.
+        Requires Python 3.6 or later.
+
+        Args:
+            packages (list(module)): A list of packages that contain submodules to document
+            index_base (str): The index page file name. This content will be appended
+            root (str): The directory to write ``index.rst`` and ``content`` into
+            concurrency (int): The maximum number of pages written at once
+            progress (callable): Called with a :class:`gendocs.aio.ProgressEvent` for every page written
+            executor (concurrent.futures.Executor): The executor to use (defaults to the loop's)
+            **kwargs: Any other arguments to :meth:`DocumentPackages` except
+                ``validate_only`` and ``bundle`` (use :meth:`DocumentPackages` for those)
+
+        Returns:
+            coroutine: Await this to run the build
+        """
+        from .aio import adocument
+        return adocument(self, packages, index_base=index_base, root=root,
+                         concurrency=concurrency, progress=progress,
+                         executor=executor, **kwargs)
@@ -0,0 +1,182 @@
+"""This provides what ``gendocs`` needs to share one output tree between
+processes. Builders such as ``make html latexpdf linkcheck`` evaluate
+``conf.py`` once per builder, so the same pages can be requested several times
+in a row or even at the same time.
+
+- Generation is guarded by a ``FileLock`` on the output root (``.gendocs.lock``)
+  so concurrent runs wait for each other instead of corrupting ``content``.
+  The lock file is removed again when the run finishes.
+- With ``DocumentPackages(..., reuse=True)``, a finished run leaves a stamp
+  (``.gendocs-stamp``) recording a ``Fingerprint`` of its options and of the
+  documented source files along with a digest of every page it wrote. A later
+  run with the same fingerprint keeps the existing pages if none of them were
+  removed or changed since. Add ``.gendocs-stamp`` to your ``.gitignore``.
+"""
+
+__all__ = [
+    'FileLock',
+    'Fingerprint',
+    'IsFresh',
+    'WriteStamp',
+    'RemoveStamp',
+]
+
+import hashlib
+import os
+import sys
+
+from .bundle import _Digest
+
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+
+LOCK_NAME = '.gendocs.lock'
+STAMP_NAME = '.gendocs-stamp'
+
+
+class FileLock(object):
+    """An exclusive lock on a file held for the duration of a ``with`` block.
+    Other processes (and threads) taking the same lock wait for its release.
+    The lock file is created when needed and removed on release (where the
+    platform allows removing an open file).
+
+    Args:
+        path (str): The lock file to use
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fid = None
+
+    def _Lock(self):
+        if fcntl is not None:
+            fcntl.flock(self._fid.fileno(), fcntl.LOCK_EX)
+            return
+        while True:
+            try:
+                self._fid.seek(0)
+                msvcrt.locking(self._fid.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except (IOError, OSError):
+                # LK_LOCK gives up after 10 seconds: keep waiting
+                continue
+
+    def acquire(self):
+        while True:
+            self._fid = open(self.path, 'a+')
+            self._Lock()
+            # The previous holder may have removed the file while we waited
+            try:
+                st = os.stat(self.path)
+            except OSError:
+                st = None
+            held = os.fstat(self._fid.fileno())
+            if st is not None and (st.st_dev, st.st_ino) == (held.st_dev, held.st_ino):
+                return
+            self._fid.close()
+
+    def release(self):
+        # Remove the file while still holding the lock so that waiters notice
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+        if fcntl is not None:
+            fcntl.flock(self._fid.fileno(), fcntl.LOCK_UN)
+        else:
+            self._fid.seek(0)
+            msvcrt.locking(self._fid.fileno(), msvcrt.LK_UNLCK, 1)
+        self._fid.close()
+        self._fid = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+        return False
+
+
+def Fingerprint(packages, options):
+    """Returns a digest of everything a generation depends on: the given
+    options and the size and modification time of every loaded module of the
+    documented packages (and of ``gendocs`` itself).
+
+    Args:
+        packages (list(module)): The packages being documented
+        options (dict): The options of the generation (``repr`` must be stable)
+
+    Returns:
+        str: The hexadecimal digest
+    """
+    tops = [p.__name__ for p in packages] + [__name__.split('.')[0]]
+    sources = []
+    for name, mod in sorted(sys.modules.items()):
+        if mod is None or not any([name == t or name.startswith(t + '.') for t in tops]):
+            continue
+        fname = getattr(mod, '__file__', None)
+        if fname is None or not os.path.exists(fname):
+            continue
+        st = os.stat(fname)
+        sources.append((name, fname, st.st_mtime, st.st_size))
+    digest = hashlib.sha1()
+    digest.update(repr(sorted(options.items())).encode('utf-8'))
+    digest.update(repr(sources).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _Pages(root):
+    """Lists the pages of a generated tree (relative to ``root``)"""
+    pages = ['index.rst']
+    content = os.path.join(root, 'content')
+    for dirpath, dirnames, filenames in os.walk(content):
+        for f in filenames:
+            pages.append(os.path.relpath(os.path.join(dirpath, f), root).replace(os.sep, '/'))
+    return sorted(pages)
+
+
+def IsFresh(fingerprint, root='.'):
+    """Tells if the tree under ``root`` was generated with the given
+    fingerprint and none of its pages were removed or changed since.
+
+    Args:
+        fingerprint (str): The fingerprint of the run about to happen
+        root (str): The directory holding ``index.rst`` and ``content``
+
+    Returns:
+        bool: ``True`` if the existing pages can be reused
+    """
+    path = os.path.join(root, STAMP_NAME)
+    if not os.path.exists(path):
+        return False
+    with open(path, 'r') as fid:
+        lines = fid.read().splitlines()
+    if len(lines) < 2 or lines[0] != fingerprint:
+        return False
+    for line in lines[1:]:
+        digest, page = line.split(' ', 1)
+        if _Digest(os.path.join(root, *page.split('/'))) != digest:
+            return False
+    return True
+
+
+def WriteStamp(fingerprint, root='.'):
+    """Records a fingerprint and a digest of every page of the tree under
+    ``root`` in its stamp file"""
+    lines = [fingerprint]
+    for page in _Pages(root):
+        lines.append('%s %s' % (_Digest(os.path.join(root, *page.split('/'))), page))
+    with open(os.path.join(root, STAMP_NAME), 'w') as fid:
+        fid.write('\n'.join(lines) + '\n')
+
+
+def RemoveStamp(root='.'):
+    """Removes the stamp under ``root`` so a partially written tree never looks fresh"""
+    path = os.path.join(root, STAMP_NAME)
+    if os.path.exists(path):
+        os.remove(path)